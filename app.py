@@ -136,8 +136,9 @@ html_content = """
         
         <div class="download-section">
             <h3>Download and Play</h3>
-            <p>Download the game and run it on your computer:</p>
+            <p>Download both files into the same folder and run them on your computer:</p>
             <a href="/download/puzzle.py" class="btn">Download Game</a>
+            <a href="/download/solver.py" class="btn">Download Solver</a>
             <p>Requirements: Python 3.10+ and Pygame library</p>
             <p>Run with: <code>python puzzle.py</code></p>
         </div>
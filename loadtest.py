@@ -0,0 +1,195 @@
+"""
+8-Puzzle Web Service Load Tester
+Drives the Flask routes in app.py (or the /solve endpoint of server.py)
+with concurrent traffic and reports throughput and latency percentiles
+"""
+
+import argparse
+import http.client
+import json
+import random
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+from metrics import percentile
+from solver import random_board
+
+# Number of random shuffle moves used to build each board difficulty
+DIFFICULTY_MOVES = {
+    'easy': 10,
+    'hard': 100,
+}
+
+# Default request mix: name -> weight
+DEFAULT_MIX = {
+    'index': 5,
+    'download': 1,
+}
+
+
+def build_requests(base_url, solve_path=None, download_file='puzzle.py'):
+    """Map request-mix names to functions that build a urllib Request"""
+    base_url = base_url.rstrip('/')
+    builders = {
+        'index': lambda: urllib.request.Request(base_url + '/'),
+        'download': lambda: urllib.request.Request(base_url + '/download/' + download_file),
+    }
+    if solve_path:
+        for difficulty, shuffle_moves in DIFFICULTY_MOVES.items():
+            def build(shuffle_moves=shuffle_moves):
+                body = json.dumps({'board': random_board(shuffle_moves)}).encode('utf-8')
+                return urllib.request.Request(
+                    base_url + solve_path, data=body, method='POST',
+                    headers={'Content-Type': 'application/json'}
+                )
+            builders['solve-' + difficulty] = build
+    return builders
+
+
+def parse_mix(spec):
+    """Parse a mix like 'index=5,download=1,solve-hard=2' into a dict"""
+    mix = {}
+    for part in spec.split(','):
+        part = part.strip()
+        if not part:
+            continue
+        name, _, weight = part.partition('=')
+        try:
+            value = float(weight) if weight else 1.0
+        except ValueError:
+            raise ValueError(f"Invalid weight for {name.strip()!r}: {weight!r}")
+        if not value >= 0:
+            raise ValueError(f"Weight for {name.strip()!r} must be a non-negative number")
+        mix[name.strip()] = value
+    if not mix or not any(mix.values()):
+        raise ValueError("Request mix needs at least one positive weight")
+    return mix
+
+
+def summarize(latencies, errors, elapsed):
+    """Throughput and latency percentiles (milliseconds) for one set of samples"""
+    ordered = sorted(latencies)
+    count = len(ordered)
+    return {
+        'requests': count,
+        'errors': errors,
+        'throughput_rps': round(count / elapsed, 2) if elapsed > 0 else 0.0,
+        'mean_ms': round(sum(ordered) / count * 1000, 3) if count else 0.0,
+        'p50_ms': round(percentile(ordered, 50) * 1000, 3),
+        'p95_ms': round(percentile(ordered, 95) * 1000, 3),
+        'p99_ms': round(percentile(ordered, 99) * 1000, 3),
+        'max_ms': round(ordered[-1] * 1000, 3) if count else 0.0,
+    }
+
+
+def run_load(builders, mix, concurrency=8, total_requests=None, duration=10.0, timeout=30.0, seed=None):
+    """Send weighted random requests from a pool of workers and collect results"""
+    unknown = [name for name in mix if name not in builders]
+    if unknown:
+        raise ValueError(f"Unknown request kinds in mix: {', '.join(unknown)} "
+                         f"(available: {', '.join(sorted(builders))})")
+
+    rng = random.Random(seed)
+    names = list(mix)
+    weights = [mix[name] for name in names]
+    lock = threading.Lock()
+    samples = {name: [] for name in names}
+    errors = {name: 0 for name in names}
+    issued = [0]
+    deadline = time.perf_counter() + duration if total_requests is None else None
+
+    def next_kind():
+        with lock:
+            if total_requests is not None:
+                if issued[0] >= total_requests:
+                    return None
+            elif time.perf_counter() >= deadline:
+                return None
+            issued[0] += 1
+            return rng.choices(names, weights)[0]
+
+    def worker():
+        while True:
+            kind = next_kind()
+            if kind is None:
+                return
+            request = builders[kind]()
+            start = time.perf_counter()
+            ok = True
+            try:
+                with urllib.request.urlopen(request, timeout=timeout) as response:
+                    response.read()
+            except (urllib.error.URLError, http.client.HTTPException, OSError):
+                ok = False
+            latency = time.perf_counter() - start
+            with lock:
+                if ok:
+                    samples[kind].append(latency)
+                else:
+                    errors[kind] += 1
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        workers = [pool.submit(worker) for _ in range(concurrency)]
+    for future in workers:
+        # Re-raise anything unexpected instead of reporting a run with fewer workers
+        future.result()
+    elapsed = time.perf_counter() - started
+
+    all_latencies = [latency for values in samples.values() for latency in values]
+    return {
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'concurrency': concurrency,
+        'mix': mix,
+        'elapsed_s': round(elapsed, 3),
+        'overall': summarize(all_latencies, sum(errors.values()), elapsed),
+        'by_kind': {name: summarize(samples[name], errors[name], elapsed) for name in names},
+    }
+
+
+def print_report(result):
+    """Print a readable table of the results"""
+    print(f"Concurrency: {result['concurrency']}  Elapsed: {result['elapsed_s']}s")
+    header = f"{'kind':<14}{'reqs':>8}{'errs':>6}{'rps':>10}{'p50':>10}{'p95':>10}{'p99':>10}"
+    print(header)
+    print('-' * len(header))
+    rows = list(result['by_kind'].items()) + [('overall', result['overall'])]
+    for name, stats in rows:
+        print(f"{name:<14}{stats['requests']:>8}{stats['errors']:>6}{stats['throughput_rps']:>10}"
+              f"{stats['p50_ms']:>10}{stats['p95_ms']:>10}{stats['p99_ms']:>10}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test the 8-puzzle web service")
+    parser.add_argument('--url', default='http://127.0.0.1:5000', help="Base URL of the running server")
+    parser.add_argument('--concurrency', type=int, default=8, help="Number of concurrent workers")
+    parser.add_argument('--requests', type=int, default=None, help="Total requests (overrides --duration)")
+    parser.add_argument('--duration', type=float, default=10.0, help="Test duration in seconds")
+    parser.add_argument('--mix', default=None,
+                        help="Weighted request mix, e.g. 'index=5,download=1,solve-easy=3,solve-hard=1'")
+    parser.add_argument('--solve-path', default=None,
+                        help="Path of a solver endpoint accepting POST {\"board\": [[...]]}")
+    parser.add_argument('--timeout', type=float, default=30.0, help="Per-request timeout in seconds")
+    parser.add_argument('--seed', type=int, default=None, help="Random seed for the request mix")
+    parser.add_argument('--output', default=None, help="Append the JSON result to this file (one per line)")
+    args = parser.parse_args()
+
+    builders = build_requests(args.url, args.solve_path)
+    try:
+        mix = parse_mix(args.mix) if args.mix else dict(DEFAULT_MIX)
+        result = run_load(builders, mix, args.concurrency, args.requests, args.duration, args.timeout, args.seed)
+    except ValueError as error:
+        parser.error(str(error))
+
+    result['url'] = args.url
+    print_report(result)
+    if args.output:
+        with open(args.output, 'a') as f:
+            f.write(json.dumps(result) + '\n')
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,198 @@
+"""
+8-Puzzle Move Encoding
+Packs solution paths into 2 bits per blank move so they are cheap to
+store, cache and send, and can be streamed while they are produced
+"""
+
+import struct
+
+from solver import DIRECTIONS, GRID_SIZE, find_empty
+
+# Header: board size (1 byte) and number of moves (4 bytes, big-endian)
+HEADER = struct.Struct('>BI')
+MOVES_PER_BYTE = 4
+
+# Direction code for each (row, col) offset the blank moves by
+DIRECTION_CODES = {offset: code for code, offset in enumerate(DIRECTIONS)}
+
+# Every byte unpacked into its four direction codes, high bits first
+UNPACKED = [(byte >> 6, (byte >> 4) & 3, (byte >> 2) & 3, byte & 3) for byte in range(256)]
+
+
+def goal_board(grid_size):
+    """Goal board (tiles in order, empty space last) for any board size"""
+    return [[(row * grid_size + col + 1) % (grid_size * grid_size) for col in range(grid_size)]
+            for row in range(grid_size)]
+
+
+def check_board(board):
+    """Raise ValueError unless board is a square grid holding one empty tile"""
+    if not isinstance(board, list) or not board:
+        raise ValueError("Board must be a non-empty list of rows")
+    if any(not isinstance(row, list) or len(row) != len(board) for row in board):
+        raise ValueError(f"Board must be a {len(board)}x{len(board)} grid")
+    if sum(row.count(0) for row in board) != 1:
+        raise ValueError("Board must hold exactly one empty tile")
+
+
+def direction_code(empty_pos, move, grid_size=GRID_SIZE):
+    """Direction code for sliding the tile at move into the empty position"""
+    row, col = empty_pos
+    new_row, new_col = move
+    code = DIRECTION_CODES.get((new_row - row, new_col - col))
+    if code is None:
+        raise ValueError(f"Move to {move} is not adjacent to the empty tile at {empty_pos}")
+    if not (0 <= new_row < grid_size and 0 <= new_col < grid_size):
+        raise ValueError(f"Move to {move} is off the {grid_size}x{grid_size} board")
+    return code
+
+
+def path_to_directions(empty_pos, path, grid_size=GRID_SIZE):
+    """Convert tile positions to move into blank direction codes, checking bounds"""
+    directions = []
+    for move in path:
+        directions.append(direction_code(empty_pos, move, grid_size))
+        empty_pos = move
+    return directions
+
+
+def directions_to_path(empty_pos, directions, grid_size=GRID_SIZE):
+    """Convert blank direction codes back to tile positions, checking bounds"""
+    row, col = empty_pos
+    path = []
+    for code in directions:
+        dr, dc = DIRECTIONS[code]
+        row, col = row + dr, col + dc
+        if not (0 <= row < grid_size and 0 <= col < grid_size):
+            raise ValueError(f"Move {len(path) + 1} takes the empty tile off the board")
+        path.append((row, col))
+    return path
+
+
+def pack_directions(directions):
+    """Pack direction codes four to a byte; the last byte is zero padded"""
+    padded = list(directions) + [0] * (-len(directions) % MOVES_PER_BYTE)
+    return bytes((padded[i] << 6) | (padded[i + 1] << 4) | (padded[i + 2] << 2) | padded[i + 3]
+                 for i in range(0, len(padded), MOVES_PER_BYTE))
+
+
+def encode_moves(directions, grid_size=GRID_SIZE):
+    """Encode direction codes with a board size and length header"""
+    return HEADER.pack(grid_size, len(directions)) + pack_directions(directions)
+
+
+def decode_moves(data):
+    """Decode a packed move sequence into (grid_size, direction codes)"""
+    if len(data) < HEADER.size:
+        raise ValueError("Move data is shorter than its header")
+    grid_size, count = HEADER.unpack_from(data)
+    body = memoryview(data)[HEADER.size:]
+    if len(body) != (count + MOVES_PER_BYTE - 1) // MOVES_PER_BYTE:
+        raise ValueError(f"Move data holds {len(body)} bytes but its header says {count} moves")
+    directions = [code for byte in body for code in UNPACKED[byte]]
+    del directions[count:]
+    return grid_size, directions
+
+
+def encode_path(board, path):
+    """Encode a solution path (list of (row, col) tile moves) for a start board"""
+    check_board(board)
+    empty_pos = find_empty(board)
+    return encode_moves(path_to_directions(empty_pos, path, len(board)), len(board))
+
+
+def decode_path(board, data):
+    """Decode packed moves into a solution path for a start board"""
+    check_board(board)
+    grid_size, directions = decode_moves(data)
+    if grid_size != len(board):
+        raise ValueError(f"Moves are for a {grid_size}x{grid_size} board, not {len(board)}x{len(board)}")
+    empty_pos = find_empty(board)
+    return directions_to_path(empty_pos, directions, grid_size)
+
+
+def validate_moves(board, data):
+    """Check that packed moves are legal from the start board and solve it"""
+    try:
+        path = decode_path(board, data)
+    except ValueError:
+        return False
+    current = [row[:] for row in board]
+    row, col = find_empty(board)
+    for new_row, new_col in path:
+        current[row][col] = current[new_row][new_col]
+        current[new_row][new_col] = 0
+        row, col = new_row, new_col
+    return current == goal_board(len(board))
+
+
+def stream_moves(empty_pos, path, count, grid_size=GRID_SIZE, chunk_size=1024):
+    """Encode moves from any iterable, yielding the payload in chunks of up to chunk_size bytes
+
+    path may be a generator producing the solution, such as solver.iter_moves;
+    count goes in the header and must match the number of moves it produces.
+    """
+    chunk = bytearray(HEADER.pack(grid_size, count))
+    byte = 0
+    pending = 0
+    encoded = 0
+    for move in path:
+        encoded += 1
+        if encoded > count:
+            raise ValueError(f"Move stream produced more than the {count} moves in its header")
+        byte = (byte << 2) | direction_code(empty_pos, move, grid_size)
+        empty_pos = move
+        pending += 1
+        if pending == MOVES_PER_BYTE:
+            chunk.append(byte)
+            byte = 0
+            pending = 0
+            if len(chunk) >= chunk_size:
+                yield bytes(chunk)
+                chunk.clear()
+    if encoded != count:
+        raise ValueError(f"Move stream produced {encoded} moves but its header says {count}")
+    if pending:
+        chunk.append(byte << 2 * (MOVES_PER_BYTE - pending))
+    if chunk:
+        yield bytes(chunk)
+
+
+class StreamDecoder:
+    """Decode a packed move stream incrementally as chunks arrive
+
+    Pass grid_size to reject streams encoded for a different board size.
+    """
+
+    def __init__(self, grid_size=None):
+        self.buffer = b''
+        self.grid_size = grid_size
+        self.count = None
+        self.decoded = 0
+        self.remaining_bytes = None
+
+    def feed(self, chunk):
+        """Add received bytes and return the direction codes they complete"""
+        self.buffer += chunk
+        if self.count is None:
+            if len(self.buffer) < HEADER.size:
+                return []
+            grid_size, self.count = HEADER.unpack_from(self.buffer)
+            if self.grid_size is not None and grid_size != self.grid_size:
+                raise ValueError(f"Moves are for a {grid_size}x{grid_size} board, "
+                                 f"not {self.grid_size}x{self.grid_size}")
+            self.grid_size = grid_size
+            self.remaining_bytes = (self.count + MOVES_PER_BYTE - 1) // MOVES_PER_BYTE
+            self.buffer = self.buffer[HEADER.size:]
+
+        if len(self.buffer) > self.remaining_bytes:
+            raise ValueError(f"Move stream holds more bytes than its header's {self.count} moves")
+        self.remaining_bytes -= len(self.buffer)
+        directions = [code for byte in self.buffer for code in UNPACKED[byte]]
+        self.buffer = b''
+        del directions[self.count - self.decoded:]
+        self.decoded += len(directions)
+        return directions
+
+    def done(self):
+        return self.count is not None and self.decoded == self.count
@@ -6,17 +6,18 @@ A classic logic-based puzzle game with AI solving capabilities
 import pygame
 import sys
 import random
-import heapq
 import time
 from copy import deepcopy
 
+import solver
+from solver import GOAL, GRID_SIZE
+
 # Initialize pygame
 pygame.init()
 
 # Constants
 WIDTH, HEIGHT = 500, 600
 BOARD_SIZE = 450
-GRID_SIZE = 3
 TILE_SIZE = BOARD_SIZE // GRID_SIZE
 MARGIN = 25
 FPS = 60
@@ -31,9 +32,6 @@ BUTTON_TEXT_COLOR = (255, 255, 255)  # White
 HINT_COLOR = (255, 245, 157)  # Light yellow
 HIGHLIGHT_COLOR = (255, 193, 7)  # Amber for highlighting
 
-# Goal state (1-8 in order, 0 represents empty space)
-GOAL = [[1, 2, 3], [4, 5, 6], [7, 8, 0]]
-
 # Set up the display
 screen = pygame.display.set_mode((WIDTH, HEIGHT))
 pygame.display.set_caption("8-Puzzle Solver")
@@ -172,35 +170,11 @@ class PuzzleGame:
     
     def is_solvable(self):
         """Check if the current board configuration is solvable"""
-        flat_board = [tile for row in self.board for tile in row]
-        inversions = 0
-        for i in range(len(flat_board)):
-            if flat_board[i] == 0:
-                continue
-            for j in range(i + 1, len(flat_board)):
-                if flat_board[j] == 0:
-                    continue
-                if flat_board[i] > flat_board[j]:
-                    inversions += 1
-        # For 3x3 puzzle, solvable if inversions is even
-        return inversions % 2 == 0
+        return solver.is_solvable(self.board)
     
     def get_valid_moves(self):
         """Get all valid moves from current position"""
-        valid_moves = []
-        row, col = self.empty_pos
-        
-        # Check all four directions
-        directions = [(-1, 0), (1, 0), (0, -1), (0, 1)]  # Up, Down, Left, Right
-        
-        for dr, dc in directions:
-            new_row, new_col = row + dr, col + dc
-            
-            # Check if the new position is within the grid
-            if 0 <= new_row < GRID_SIZE and 0 <= new_col < GRID_SIZE:
-                valid_moves.append((new_row, new_col))
-        
-        return valid_moves
+        return solver.get_valid_moves(self.empty_pos)
     
     def move_tile(self, row, col, count_move=True):
         """Move a tile to the empty position if it's adjacent"""
@@ -239,43 +213,11 @@ class PuzzleGame:
     
     def greedy_best_first_search(self):
         """Use Greedy Best-First Search to find the best next move"""
-        valid_moves = self.get_valid_moves()
-        if not valid_moves:
-            return None
-        
-        best_move = None
-        best_score = float('inf')
-        
-        for move in valid_moves:
-            # Create a new board with this move
-            new_board = deepcopy(self.board)
-            empty_row, empty_col = self.empty_pos
-            row, col = move
-            
-            # Swap the tile with the empty space
-            new_board[empty_row][empty_col] = new_board[row][col]
-            new_board[row][col] = 0
-            
-            # Calculate Manhattan distance for this new state
-            score = self.manhattan_distance(new_board)
-            
-            if score < best_score:
-                best_score = score
-                best_move = move
-        
-        return best_move
+        return solver.greedy_best_first_search(self.board, self.empty_pos)
     
     def manhattan_distance(self, board):
         """Calculate Manhattan distance heuristic for a board state"""
-        distance = 0
-        for i in range(GRID_SIZE):
-            for j in range(GRID_SIZE):
-                tile = board[i][j]
-                if tile != 0:  # Skip the empty tile
-                    # Calculate the expected position of this tile in the goal state
-                    goal_row, goal_col = (tile - 1) // GRID_SIZE, (tile - 1) % GRID_SIZE
-                    distance += abs(i - goal_row) + abs(j - goal_col)
-        return distance
+        return solver.manhattan_distance(board)
     
     def solve_puzzle(self):
         """Solve the puzzle using A* algorithm"""
@@ -296,62 +238,7 @@ class PuzzleGame:
     
     def a_star_solver(self):
         """A* algorithm to find the optimal solution path"""
-        # Initial state
-        initial_state = (self.manhattan_distance(self.board), 0, self.board, self.empty_pos, [])
-        visited = set()
-        queue = [initial_state]
-        heapq.heapify(queue)
-        
-        max_iterations = 10000  # Limit iterations to prevent infinite loops
-        iterations = 0
-        
-        while queue and iterations < max_iterations:
-            iterations += 1
-            _, moves, current, empty_pos, path = heapq.heappop(queue)
-            
-            # Convert the current board to a tuple for hashing
-            board_tuple = tuple(tuple(row) for row in current)
-            
-            # Skip if we've seen this state before
-            if board_tuple in visited:
-                continue
-            
-            visited.add(board_tuple)
-            
-            # Check if we've reached the goal
-            if current == GOAL:
-                print(f"Solution found in {iterations} iterations")
-                return path
-            
-            # Get valid moves from current state
-            row, col = empty_pos
-            directions = [(-1, 0), (1, 0), (0, -1), (0, 1)]  # Up, Down, Left, Right
-            
-            for dr, dc in directions:
-                new_row, new_col = row + dr, col + dc
-                
-                # Check if the new position is within the grid
-                if 0 <= new_row < GRID_SIZE and 0 <= new_col < GRID_SIZE:
-                    # Create a new board with this move
-                    new_board = deepcopy(current)
-                    
-                    # Swap the tile with the empty space
-                    new_board[row][col] = new_board[new_row][new_col]
-                    new_board[new_row][new_col] = 0
-                    new_empty_pos = (new_row, new_col)
-                    
-                    # Add the move to the path
-                    new_path = path + [(new_row, new_col)]
-                    
-                    # Calculate Manhattan distance for this new state
-                    h_score = self.manhattan_distance(new_board)
-                    g_score = moves + 1
-                    f_score = g_score + h_score
-                    
-                    heapq.heappush(queue, (f_score, g_score, new_board, new_empty_pos, new_path))
-        
-        print(f"No solution found after {iterations} iterations")
-        return []  # No solution found
+        return solver.a_star_solver(self.board)
     
     def update(self):
         """Update game state"""
@@ -0,0 +1,406 @@
+"""
+8-Puzzle Session Server
+An asyncio HTTP server that holds many concurrent game sessions and handles
+tile moves, hints and solves as JSON messages
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+import uuid
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from urllib.parse import parse_qs, urlsplit
+
+import movecode
+import solver
+from metrics import percentile
+from solver import GOAL, GRID_SIZE
+
+MAX_BODY_SIZE = 64 * 1024
+SHUFFLE_MOVES = 100
+SOLUTION_FORMATS = (None, 'json', 'packed')
+STREAM_CHUNK_SIZE = 256
+
+STATUS_TEXT = {
+    200: 'OK',
+    400: 'Bad Request',
+    404: 'Not Found',
+    405: 'Method Not Allowed',
+    409: 'Conflict',
+    413: 'Payload Too Large',
+    431: 'Request Header Fields Too Large',
+    422: 'Unprocessable Entity',
+    500: 'Internal Server Error',
+}
+
+
+class RequestError(Exception):
+    """A client error that is returned as a JSON error response"""
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+class Session:
+    """Compact state of one game: the board is packed row-major into bytes"""
+
+    __slots__ = ('board', 'empty', 'moves', 'start_time', 'last_seen', 'solving')
+
+    def __init__(self, board):
+        self.board = bytearray(tile for row in board for tile in row)
+        self.empty = self.board.index(0)
+        self.moves = 0
+        self.start_time = time.time()
+        self.last_seen = time.monotonic()
+        self.solving = False
+
+    def rows(self):
+        """Unpack the board into the list-of-rows form used by the solver"""
+        return [list(self.board[i:i + GRID_SIZE]) for i in range(0, GRID_SIZE * GRID_SIZE, GRID_SIZE)]
+
+    def empty_pos(self):
+        return divmod(self.empty, GRID_SIZE)
+
+    def move_tile(self, row, col):
+        """Move a tile to the empty position if it's adjacent"""
+        if not (0 <= row < GRID_SIZE and 0 <= col < GRID_SIZE):
+            return False
+        empty_row, empty_col = divmod(self.empty, GRID_SIZE)
+        if abs(row - empty_row) + abs(col - empty_col) != 1:
+            return False
+        index = row * GRID_SIZE + col
+        self.board[self.empty] = self.board[index]
+        self.board[index] = 0
+        self.empty = index
+        self.moves += 1
+        return True
+
+    def is_solved(self):
+        return self.rows() == GOAL
+
+    def to_dict(self):
+        return {
+            'board': self.rows(),
+            'moves': self.moves,
+            'elapsed': round(time.time() - self.start_time, 3),
+            'solved': self.is_solved(),
+        }
+
+    def memory_size(self):
+        """Bytes held by this session: the object, its packed board and its timestamps"""
+        size = (sys.getsizeof(self) + sys.getsizeof(self.board)
+                + sys.getsizeof(self.start_time) + sys.getsizeof(self.last_seen))
+        if self.moves > 256:  # Smaller ints are shared by the interpreter
+            size += sys.getsizeof(self.moves)
+        return size
+
+
+class SessionServer:
+    """Holds game sessions and dispatches messages to them"""
+
+    def __init__(self, executor, idle_timeout=300.0, latency_samples=10000):
+        self.executor = executor
+        self.idle_timeout = idle_timeout
+        self.sessions = {}
+        self.latencies = deque(maxlen=latency_samples)
+        self.messages = 0
+        self.evicted = 0
+
+    def new_session(self):
+        session_id = uuid.uuid4().hex
+        self.sessions[session_id] = Session(solver.random_board(SHUFFLE_MOVES))
+        return session_id
+
+    def get_session(self, session_id):
+        session = self.sessions.get(session_id)
+        if session is None:
+            raise RequestError(404, f"Unknown session: {session_id}")
+        session.last_seen = time.monotonic()
+        return session
+
+    def evict_idle(self):
+        """Remove sessions that have not received a message within idle_timeout"""
+        cutoff = time.monotonic() - self.idle_timeout
+        idle = [session_id for session_id, session in self.sessions.items()
+                if session.last_seen < cutoff and not session.solving]
+        for session_id in idle:
+            del self.sessions[session_id]
+        self.evicted += len(idle)
+        return len(idle)
+
+    async def run_eviction(self, interval):
+        while True:
+            await asyncio.sleep(interval)
+            self.evict_idle()
+
+    async def solve(self, board):
+        """Run the A* search in the executor so it never blocks the event loop
+
+        Returns (moves, node) where node links the board to the goal in
+        solving order, and raises a 422 error if no solution is found.
+        """
+        loop = asyncio.get_running_loop()
+        result = await loop.run_in_executor(self.executor, solver.a_star_from_goal, board)
+        if result is None:
+            raise RequestError(422, "No solution found within the search limit")
+        return result
+
+    async def handle_message(self, session_id, message):
+        session = self.get_session(session_id)
+        kind = message.get('type')
+
+        if kind == 'state':
+            return session.to_dict()
+
+        if kind == 'new':
+            self.sessions[session_id] = session = Session(solver.random_board(SHUFFLE_MOVES))
+            return session.to_dict()
+
+        if session.solving:
+            raise RequestError(409, "Session is busy solving")
+
+        if kind == 'move':
+            try:
+                row, col = message['row'], message['col']
+            except KeyError:
+                row = col = None
+            if type(row) is not int or type(col) is not int:
+                raise RequestError(400, "Move needs integer 'row' and 'col'")
+            moved = session.move_tile(row, col)
+            result = session.to_dict()
+            result['moved'] = moved
+            return result
+
+        if kind == 'hint':
+            hint = solver.greedy_best_first_search(session.rows(), session.empty_pos())
+            return {'hint': list(hint) if hint else None}
+
+        if kind == 'solve':
+            session.solving = True
+            empty_pos = session.empty_pos()
+            board = session.rows()
+            try:
+                moves, node = await self.solve(board)
+            finally:
+                session.solving = False
+            return self.solution_response(empty_pos, moves, node, message.get('format'))
+
+        raise RequestError(400, f"Unknown message type: {kind!r}")
+
+    async def handle_solve(self, message):
+        """Stateless solve of a board posted as {"board": [[...]]}"""
+        board = message.get('board')
+        if (not isinstance(board, list) or len(board) != GRID_SIZE
+                or any(not isinstance(row, list) or len(row) != GRID_SIZE for row in board)
+                or any(type(tile) is not int for row in board for tile in row)
+                or sorted(tile for row in board for tile in row) != list(range(GRID_SIZE * GRID_SIZE))):
+            raise RequestError(400, "Board must be a 3x3 grid holding tiles 0-8")
+        if not solver.is_solvable(board):
+            raise RequestError(400, "Board is not solvable")
+        empty_pos = solver.find_empty(board)
+        moves, node = await self.solve(board)
+        return self.solution_response(empty_pos, moves, node, message.get('format'))
+
+    def solution_response(self, empty_pos, moves, node, response_format=None):
+        """Solution as JSON moves, or as a generator of packed 2-bit move chunks
+
+        The packed form is encoded while the parent links are followed, so
+        each chunk is sent as soon as its moves are known.
+        """
+        if response_format == 'packed':
+            return movecode.stream_moves(empty_pos, solver.iter_moves(node), moves,
+                                         chunk_size=STREAM_CHUNK_SIZE)
+        return {'solution': [list(move) for move in solver.iter_moves(node)]}
+
+    def stats(self):
+        # Count each session id and its share of the sessions dict as well as the session itself
+        sizes = [sys.getsizeof(session_id) + session.memory_size()
+                 for session_id, session in self.sessions.items()]
+        ordered = sorted(self.latencies)
+        return {
+            'sessions': len(self.sessions),
+            'evicted': self.evicted,
+            'messages': self.messages,
+            'bytes_per_session': round((sum(sizes) + sys.getsizeof(self.sessions)) / len(sizes), 1) if sizes else 0.0,
+            'p50_ms': round(percentile(ordered, 50) * 1000, 3),
+            'p95_ms': round(percentile(ordered, 95) * 1000, 3),
+            'p99_ms': round(percentile(ordered, 99) * 1000, 3),
+        }
+
+    async def dispatch(self, method, path, message):
+        """Route one request to its handler and return the JSON payload or raw bytes"""
+        url = urlsplit(path)
+        parts = [part for part in url.path.split('/') if part]
+        query = parse_qs(url.query)
+        if 'format' in query:
+            message.setdefault('format', query['format'][0])
+        if message.get('format') not in SOLUTION_FORMATS:
+            raise RequestError(400, f"Unknown solution format: {message['format']!r}")
+
+        if parts == ['sessions'] and method == 'POST':
+            session_id = self.new_session()
+            return dict(self.sessions[session_id].to_dict(), session=session_id)
+        if len(parts) == 2 and parts[0] == 'sessions':
+            if method == 'POST':
+                return await self.handle_message(parts[1], message)
+            if method == 'DELETE':
+                self.get_session(parts[1])
+                del self.sessions[parts[1]]
+                return {'deleted': parts[1]}
+            raise RequestError(405, f"Method not allowed: {method}")
+        if parts == ['solve'] and method == 'POST':
+            return await self.handle_solve(message)
+        if parts == ['stats'] and method == 'GET':
+            return self.stats()
+        raise RequestError(404, f"Not found: {method} {path}")
+
+    async def write_response(self, writer, status, payload, keep_alive, chunked=True):
+        """Send a JSON payload, or a generator of byte chunks as application/octet-stream"""
+        if isinstance(payload, dict):
+            content_type = 'application/json'
+            data = json.dumps(payload).encode('utf-8')
+        elif chunked:
+            await self.write_stream(writer, status, payload, keep_alive)
+            return
+        else:
+            # HTTP/1.0 clients cannot read chunked bodies
+            content_type = 'application/octet-stream'
+            data = b''.join(payload)
+        writer.write(
+            f"HTTP/1.1 {status} {STATUS_TEXT[status]}\r\n"
+            f"Content-Type: {content_type}\r\n"
+            f"Content-Length: {len(data)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode('latin-1') + data
+        )
+        await writer.drain()
+
+    async def write_stream(self, writer, status, chunks, keep_alive):
+        """Send each chunk as soon as it is produced, using chunked transfer encoding"""
+        writer.write(
+            f"HTTP/1.1 {status} {STATUS_TEXT[status]}\r\n"
+            f"Content-Type: application/octet-stream\r\n"
+            f"Transfer-Encoding: chunked\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode('latin-1')
+        )
+        for chunk in chunks:
+            writer.write(b'%x\r\n%s\r\n' % (len(chunk), chunk))
+            await writer.drain()
+        writer.write(b'0\r\n\r\n')
+        await writer.drain()
+
+    async def handle_connection(self, reader, writer):
+        """Serve HTTP/1.1 requests on one connection, keeping it alive if asked"""
+        try:
+            while True:
+                try:
+                    request_line = await reader.readline()
+                    if not request_line:
+                        break
+                    headers = {}
+                    while True:
+                        line = await reader.readline()
+                        if line in (b'\r\n', b'\n', b''):
+                            break
+                        name, _, value = line.decode('latin-1').partition(':')
+                        headers[name.strip().lower()] = value.strip()
+                except ValueError:
+                    # readline() raises ValueError when a line is longer than the stream limit
+                    await self.write_response(writer, 431, {'error': "Request line or header too long"}, False)
+                    break
+                try:
+                    method, path, version = request_line.decode('latin-1').split()
+                except ValueError:
+                    await self.write_response(writer, 400, {'error': "Malformed request line"}, False)
+                    break
+
+                start = time.perf_counter()
+                status = 200
+                body_read = False
+                try:
+                    try:
+                        length = int(headers.get('content-length', 0))
+                    except ValueError:
+                        raise RequestError(400, "Invalid Content-Length header")
+                    if length < 0:
+                        raise RequestError(400, "Invalid Content-Length header")
+                    if length > MAX_BODY_SIZE:
+                        raise RequestError(413, "Request body too large")
+                    body = await reader.readexactly(length) if length else b''
+                    body_read = True
+                    try:
+                        message = json.loads(body) if body else {}
+                    except ValueError:
+                        raise RequestError(400, "Body must be JSON")
+                    if not isinstance(message, dict):
+                        raise RequestError(400, "Body must be a JSON object")
+                    payload = await self.dispatch(method.upper(), path, message)
+                except RequestError as error:
+                    status = error.status
+                    payload = {'error': error.message}
+                except (ConnectionError, asyncio.IncompleteReadError):
+                    raise
+                except Exception as error:
+                    print(f"Error handling {method} {path}: {error!r}", file=sys.stderr)
+                    status = 500
+                    payload = {'error': "Internal server error"}
+
+                # An unread body would be parsed as the next request, so close instead
+                keep_alive = (body_read and headers.get('connection', '').lower() != 'close'
+                              and version.upper() == 'HTTP/1.1')
+                try:
+                    await self.write_response(writer, status, payload, keep_alive,
+                                              chunked=version.upper() == 'HTTP/1.1')
+                except (ConnectionError, asyncio.IncompleteReadError):
+                    raise
+                except Exception as error:
+                    # The status line may already be sent, so the only safe signal is to drop the connection
+                    print(f"Error sending response to {method} {path}: {error!r}", file=sys.stderr)
+                    break
+                self.messages += 1
+                self.latencies.append(time.perf_counter() - start)
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+
+async def serve(host, port, workers=None, idle_timeout=300.0, sweep_interval=30.0, use_threads=False):
+    executor_class = ThreadPoolExecutor if use_threads else ProcessPoolExecutor
+    with executor_class(max_workers=workers) as executor:
+        app = SessionServer(executor, idle_timeout)
+        server = await asyncio.start_server(app.handle_connection, host, port, backlog=1024)
+        eviction = asyncio.create_task(app.run_eviction(sweep_interval))
+        print(f"Session server listening on http://{host}:{port}")
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            eviction.cancel()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve many concurrent 8-puzzle sessions")
+    parser.add_argument('--host', default='127.0.0.1', help="Interface to listen on")
+    parser.add_argument('--port', type=int, default=8765, help="Port to listen on")
+    parser.add_argument('--workers', type=int, default=None, help="Solver executor workers")
+    parser.add_argument('--threads', action='store_true', help="Solve in threads instead of processes")
+    parser.add_argument('--idle-timeout', type=float, default=300.0, help="Seconds before an idle session is evicted")
+    parser.add_argument('--sweep-interval', type=float, default=30.0, help="Seconds between eviction sweeps")
+    args = parser.parse_args()
+
+    try:
+        asyncio.run(serve(args.host, args.port, args.workers, args.idle_timeout,
+                          args.sweep_interval, args.threads))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
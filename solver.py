@@ -0,0 +1,253 @@
+"""
+8-Puzzle Solver Logic
+Board helpers and search algorithms shared by the game and the session server
+"""
+
+import random
+from copy import deepcopy
+
+# Goal state (1-8 in order, 0 represents empty space)
+GOAL = [[1, 2, 3], [4, 5, 6], [7, 8, 0]]
+GRID_SIZE = 3
+
+DIRECTIONS = [(-1, 0), (1, 0), (0, -1), (0, 1)]  # Up, Down, Left, Right
+
+# Flat-board lookups used by the A* search: the cells next to each cell, and
+# the Manhattan distance between every pair of cells
+CELLS = range(GRID_SIZE * GRID_SIZE)
+NEIGHBORS = [[r * GRID_SIZE + c for r, c in
+              ((i // GRID_SIZE + dr, i % GRID_SIZE + dc) for dr, dc in DIRECTIONS)
+              if 0 <= r < GRID_SIZE and 0 <= c < GRID_SIZE] for i in CELLS]
+DISTANCE = [[abs(a // GRID_SIZE - b // GRID_SIZE) + abs(a % GRID_SIZE - b % GRID_SIZE)
+             for b in CELLS] for a in CELLS]
+
+
+class BucketQueue:
+    """Priority queue for small integer priorities, used as a best-first frontier
+
+    Items live in buckets indexed by f and then by g. Popping returns an item
+    with the lowest f, preferring the highest g and then the most recently
+    pushed item. Push and pop are O(1) amortized and never compare items.
+    """
+
+    def __init__(self):
+        self.buckets = []  # buckets[f][g] is a stack of items
+        self.counts = []   # number of items stored under each f
+        self.min_f = 0
+        self.size = 0
+
+    def __len__(self):
+        return self.size
+
+    def push(self, f, g, item):
+        """Add an item with integer priority f (lower first) and tie-breaker g (higher first)"""
+        if f < 0 or g < 0:
+            raise ValueError(f"BucketQueue priorities must not be negative (f={f}, g={g})")
+        if f >= len(self.buckets):
+            extra = f + 1 - len(self.buckets)
+            self.buckets.extend([] for _ in range(extra))
+            self.counts.extend([0] * extra)
+        bucket = self.buckets[f]
+        if g >= len(bucket):
+            bucket.extend([] for _ in range(g + 1 - len(bucket)))
+        bucket[g].append(item)
+        self.counts[f] += 1
+        if f < self.min_f or self.size == 0:
+            self.min_f = f
+        self.size += 1
+
+    def pop(self):
+        """Remove and return (f, g, item) for the best item"""
+        if not self.size:
+            raise IndexError("pop from an empty BucketQueue")
+        while not self.counts[self.min_f]:
+            self.min_f += 1
+        bucket = self.buckets[self.min_f]
+        while not bucket[-1]:
+            bucket.pop()
+        item = bucket[-1].pop()
+        self.counts[self.min_f] -= 1
+        self.size -= 1
+        return self.min_f, len(bucket) - 1, item
+
+
+def find_empty(board):
+    """Find the (row, col) position of the empty tile"""
+    for i, row in enumerate(board):
+        for j, tile in enumerate(row):
+            if tile == 0:
+                return (i, j)
+    return None
+
+
+def is_solvable(board):
+    """Check if a board configuration is solvable"""
+    flat_board = [tile for row in board for tile in row]
+    inversions = 0
+    for i in range(len(flat_board)):
+        if flat_board[i] == 0:
+            continue
+        for j in range(i + 1, len(flat_board)):
+            if flat_board[j] == 0:
+                continue
+            if flat_board[i] > flat_board[j]:
+                inversions += 1
+    # For 3x3 puzzle, solvable if inversions is even
+    return inversions % 2 == 0
+
+
+def get_valid_moves(empty_pos):
+    """Get all tile positions that can slide into the empty position"""
+    valid_moves = []
+    row, col = empty_pos
+
+    for dr, dc in DIRECTIONS:
+        new_row, new_col = row + dr, col + dc
+
+        # Check if the new position is within the grid
+        if 0 <= new_row < GRID_SIZE and 0 <= new_col < GRID_SIZE:
+            valid_moves.append((new_row, new_col))
+
+    return valid_moves
+
+
+def random_board(shuffle_moves):
+    """Build a solvable board by walking the empty tile away from the goal"""
+    board = [row[:] for row in GOAL]
+    row, col = GRID_SIZE - 1, GRID_SIZE - 1
+    previous = None
+    for _ in range(shuffle_moves):
+        moves = []
+        for move in get_valid_moves((row, col)):
+            if move != previous:
+                moves.append(move)
+        new_row, new_col = random.choice(moves)
+        board[row][col] = board[new_row][new_col]
+        board[new_row][new_col] = 0
+        previous = (row, col)
+        row, col = new_row, new_col
+    return board
+
+
+def manhattan_distance(board):
+    """Calculate Manhattan distance heuristic for a board state"""
+    distance = 0
+    for i in range(GRID_SIZE):
+        for j in range(GRID_SIZE):
+            tile = board[i][j]
+            if tile != 0:  # Skip the empty tile
+                # Calculate the expected position of this tile in the goal state
+                goal_row, goal_col = (tile - 1) // GRID_SIZE, (tile - 1) % GRID_SIZE
+                distance += abs(i - goal_row) + abs(j - goal_col)
+    return distance
+
+
+def greedy_best_first_search(board, empty_pos):
+    """Use Greedy Best-First Search to find the best next move"""
+    valid_moves = get_valid_moves(empty_pos)
+    if not valid_moves:
+        return None
+
+    best_move = None
+    best_score = float('inf')
+
+    for move in valid_moves:
+        # Create a new board with this move
+        new_board = deepcopy(board)
+        empty_row, empty_col = empty_pos
+        row, col = move
+
+        # Swap the tile with the empty space
+        new_board[empty_row][empty_col] = new_board[row][col]
+        new_board[row][col] = 0
+
+        # Calculate Manhattan distance for this new state
+        score = manhattan_distance(new_board)
+
+        if score < best_score:
+            best_score = score
+            best_move = move
+
+    return best_move
+
+
+def a_star_search(start, goal, max_iterations=10000):
+    """A* search between two flat board tuples
+
+    Each node is a (state, empty_index, parent) tuple, so the frontier holds
+    one compact board per node and the path is only rebuilt at the end.
+    Returns (moves, node) for the node that reaches goal, or None if the
+    goal is not reached within max_iterations.
+    """
+    goal_index = [0] * len(goal)
+    for index, tile in enumerate(goal):
+        goal_index[tile] = index
+
+    # Manhattan distance to the goal, updated per move instead of recomputed
+    h_score = sum(DISTANCE[index][goal_index[tile]] for index, tile in enumerate(start) if tile)
+    queue = BucketQueue()
+    queue.push(h_score, 0, ((start, start.index(0), None), h_score))
+    visited = set()
+
+    iterations = 0
+
+    while queue and iterations < max_iterations:
+        iterations += 1
+        _, moves, (node, h_score) = queue.pop()
+        current, empty, _ = node
+
+        # Skip if we've seen this state before
+        if current in visited:
+            continue
+
+        visited.add(current)
+
+        # Check if we've reached the goal
+        if current == goal:
+            return moves, node
+
+        for index in NEIGHBORS[empty]:
+            # Slide the tile at index into the empty space
+            tile = current[index]
+            cells = list(current)
+            cells[empty] = tile
+            cells[index] = 0
+            new_state = tuple(cells)
+            if new_state in visited:
+                continue
+
+            new_h = h_score - DISTANCE[index][goal_index[tile]] + DISTANCE[empty][goal_index[tile]]
+            queue.push(moves + 1 + new_h, moves + 1, ((new_state, index, node), new_h))
+
+    return None
+
+
+def a_star_from_goal(board, max_iterations=10000):
+    """Search from the goal back to board, so parent links run in solving order
+
+    Returns (moves, node) where node holds board, or None if no solution is
+    found within max_iterations. Pass node to iter_moves to get the path.
+    """
+    start = tuple(tile for row in board for tile in row)
+    goal = tuple(tile for row in GOAL for tile in row)
+    return a_star_search(goal, start, max_iterations)
+
+
+def iter_moves(node):
+    """Yield the (row, col) tile moves from node's board to the goal, one parent link at a time"""
+    parent = node[2]
+    while parent is not None:
+        yield divmod(parent[1], GRID_SIZE)
+        parent = parent[2]
+
+
+def a_star_solver(board, max_iterations=10000):
+    """A* algorithm to find the optimal solution path
+
+    Returns the list of (row, col) tile positions to move, or an empty
+    list if no solution is found within max_iterations.
+    """
+    result = a_star_from_goal(board, max_iterations)
+    if result is None:
+        return []  # No solution found
+    return list(iter_moves(result[1]))
@@ -0,0 +1,113 @@
+import pytest
+
+import movecode
+import solver
+from solver import GOAL
+
+HARD_BOARD = [[8, 6, 7], [2, 5, 4], [3, 0, 1]]
+
+
+def walk(empty_pos, count):
+    """A legal path of count moves that bounces the empty tile left and right"""
+    row, col = empty_pos
+    path = []
+    for i in range(count):
+        col = col - 1 if i % 2 == 0 else col + 1
+        path.append((row, col))
+    return path
+
+
+@pytest.mark.parametrize('count', [0, 1, 3, 4, 5])
+def test_encode_decode_round_trip(count):
+    board = [row[:] for row in GOAL]
+    path = walk((2, 2), count)
+
+    data = movecode.encode_path(board, path)
+
+    assert len(data) == movecode.HEADER.size + (count + 3) // 4
+    assert movecode.decode_moves(data) == (3, movecode.path_to_directions((2, 2), path))
+    assert movecode.decode_path(board, data) == path
+
+
+def test_round_trip_of_solver_output():
+    path = solver.a_star_solver(HARD_BOARD)
+    data = movecode.encode_path(HARD_BOARD, path)
+    assert movecode.decode_path(HARD_BOARD, data) == path
+    assert movecode.validate_moves(HARD_BOARD, data)
+
+
+def test_encode_path_rejects_moves_off_the_board():
+    board = [[0, 1, 2], [3, 4, 5], [6, 7, 8]]
+    with pytest.raises(ValueError):
+        movecode.encode_path(board, [(-1, 0)])
+
+
+def test_encode_path_rejects_moves_not_next_to_the_empty_tile():
+    with pytest.raises(ValueError):
+        movecode.encode_path(GOAL, [(0, 0)])
+
+
+@pytest.mark.parametrize('board', [
+    [[1, 2, 3], [4, 5, 6], [7, 8, 9]],
+    [[1, 2, 3], [4, 0, 6], [7, 0, 8]],
+    [[1, 2, 3], [4, 5], [7, 8, 0]],
+    [],
+    'not a board',
+])
+def test_validate_moves_rejects_malformed_boards(board):
+    assert not movecode.validate_moves(board, movecode.encode_moves([0]))
+
+
+def test_validate_moves_rejects_moves_that_do_not_solve():
+    board = [[1, 2, 3], [4, 5, 6], [7, 0, 8]]
+    assert movecode.validate_moves(board, movecode.encode_path(board, [(2, 2)]))
+    assert not movecode.validate_moves(board, movecode.encode_path(board, [(2, 0)]))
+    assert not movecode.validate_moves(board, movecode.encode_moves([]))
+
+
+def test_validate_moves_rejects_wrong_board_size_and_truncated_data():
+    board = [[1, 2, 3], [4, 5, 6], [7, 0, 8]]
+    assert not movecode.validate_moves(board, movecode.encode_moves([3], grid_size=4))
+    assert not movecode.validate_moves(board, movecode.encode_path(board, [(2, 2)])[:-1])
+
+
+def test_stream_moves_matches_encode_path():
+    moves, node = solver.a_star_from_goal(HARD_BOARD)
+
+    chunks = list(movecode.stream_moves((2, 1), solver.iter_moves(node), moves, chunk_size=2))
+
+    assert all(len(chunk) <= movecode.HEADER.size + 2 for chunk in chunks)
+    assert b''.join(chunks) == movecode.encode_path(HARD_BOARD, solver.a_star_solver(HARD_BOARD))
+
+
+@pytest.mark.parametrize('count', [2, 6])
+def test_stream_moves_rejects_count_mismatch(count):
+    with pytest.raises(ValueError):
+        list(movecode.stream_moves((2, 2), walk((2, 2), 4), count))
+
+
+def test_stream_decoder_handles_header_split_across_chunks():
+    path = walk((2, 2), 5)
+    data = movecode.encode_path(GOAL, path)
+    decoder = movecode.StreamDecoder(grid_size=3)
+
+    directions = []
+    for i in range(len(data)):
+        directions += decoder.feed(data[i:i + 1])
+        if i < movecode.HEADER.size - 1:
+            assert decoder.count is None
+
+    assert decoder.done()
+    assert movecode.directions_to_path((2, 2), directions) == path
+
+
+def test_stream_decoder_rejects_extra_bytes():
+    decoder = movecode.StreamDecoder()
+    with pytest.raises(ValueError):
+        decoder.feed(movecode.encode_moves([0, 1]) + b'\x00')
+
+
+def test_stream_decoder_rejects_unexpected_grid_size():
+    decoder = movecode.StreamDecoder(grid_size=3)
+    with pytest.raises(ValueError):
+        decoder.feed(movecode.encode_moves([0], grid_size=4))
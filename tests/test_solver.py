@@ -0,0 +1,80 @@
+import random
+
+import pytest
+
+import solver
+from solver import GOAL, BucketQueue
+
+
+def apply_path(board, path):
+    board = [row[:] for row in board]
+    row, col = solver.find_empty(board)
+    for new_row, new_col in path:
+        assert abs(new_row - row) + abs(new_col - col) == 1
+        board[row][col] = board[new_row][new_col]
+        board[new_row][new_col] = 0
+        row, col = new_row, new_col
+    return board
+
+
+def test_bucket_queue_orders_by_lowest_f_then_highest_g_then_last_pushed():
+    queue = BucketQueue()
+    for f, g, item in [(5, 1, 'a'), (3, 0, 'b'), (5, 3, 'c'), (3, 0, 'd'), (7, 2, 'e'), (5, 3, 'f')]:
+        queue.push(f, g, item)
+
+    popped = [queue.pop() for _ in range(len(queue))]
+
+    assert popped == [(3, 0, 'd'), (3, 0, 'b'), (5, 3, 'f'), (5, 3, 'c'), (5, 1, 'a'), (7, 2, 'e')]
+    assert len(queue) == 0
+
+
+def test_bucket_queue_pops_lower_f_pushed_after_popping():
+    queue = BucketQueue()
+    queue.push(4, 1, 'a')
+    queue.push(6, 2, 'b')
+    assert queue.pop() == (4, 1, 'a')
+
+    queue.push(2, 0, 'c')
+    queue.push(5, 3, 'd')
+
+    assert [queue.pop() for _ in range(3)] == [(2, 0, 'c'), (5, 3, 'd'), (6, 2, 'b')]
+
+
+def test_bucket_queue_empty_pop_raises():
+    queue = BucketQueue()
+    queue.push(1, 1, 'a')
+    queue.pop()
+    with pytest.raises(IndexError):
+        queue.pop()
+
+
+@pytest.mark.parametrize('f, g', [(-1, 0), (0, -1)])
+def test_bucket_queue_rejects_negative_priorities(f, g):
+    queue = BucketQueue()
+    with pytest.raises(ValueError):
+        queue.push(f, g, 'a')
+    assert len(queue) == 0
+
+
+def test_a_star_solver_returns_empty_path_for_goal():
+    assert solver.a_star_solver(GOAL) == []
+
+
+def test_a_star_solver_finds_optimal_path():
+    # 31 moves is the longest optimal solution for the 8-puzzle
+    board = [[8, 6, 7], [2, 5, 4], [3, 0, 1]]
+    path = solver.a_star_solver(board)
+    assert len(path) == 31
+    assert apply_path(board, path) == GOAL
+
+
+def test_a_star_solver_solves_random_boards():
+    rng = random.Random(7)
+    for _ in range(20):
+        random.seed(rng.random())
+        board = solver.random_board(rng.randint(1, 60))
+        assert apply_path(board, solver.a_star_solver(board)) == GOAL
+
+
+def test_a_star_solver_gives_up_at_iteration_limit():
+    assert solver.a_star_solver([[8, 6, 7], [2, 5, 4], [3, 0, 1]], max_iterations=10) == []